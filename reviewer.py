@@ -2,17 +2,26 @@
 Code review logic using Zhipu GLM-4.7 via OpenAI-compatible API.
 """
 
+import functools
 import logging
 import os
 import re
 import subprocess
 import sys
-from pathlib import Path
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import unquote
 
 from openai import OpenAI
 from dotenv import load_dotenv
 
+# orjson decodes JSON several times faster than stdlib; optional dependency
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
 # Configure logging to write to stderr (keeps stdout clean for MCP protocol)
@@ -41,6 +50,81 @@ EXCLUDE_PATTERNS = [
     "pnpm-lock.yaml",
 ]
 
+# Pathspec form of the exclusions, frozen once at import instead of being
+# rebuilt on every git invocation
+_EXCLUDE_ARGS: tuple[str, ...] = tuple(f":!{pattern}" for pattern in EXCLUDE_PATTERNS)
+
+
+# Streamed diff reads: chunk size, cap on how much diff we keep in memory,
+# and a bound on how long the whole streamed call may take
+_DIFF_CHUNK_SIZE = 64 * 1024
+_MAX_DIFF_BYTES = int(os.getenv("MAX_DIFF_BYTES", str(2 * 1024 * 1024)))
+_DIFF_TIMEOUT = 30
+
+
+def _run_git_diff(args: list[str]) -> bytes:
+    """
+    Run a git diff command, streaming stdout instead of buffering it.
+
+    Reads the pipe in chunks into a bytearray and returns raw bytes so
+    callers can split/index without decoding first; only the slices that
+    are actually used get decoded. Output beyond _MAX_DIFF_BYTES is
+    drained and discarded, with a truncation marker appended. stderr is
+    drained on a side thread so git can't deadlock on a full pipe, and
+    a timer kills git if the whole call exceeds _DIFF_TIMEOUT seconds.
+
+    Raises subprocess.CalledProcessError on nonzero exit and
+    subprocess.TimeoutExpired on timeout.
+    """
+    process = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        stdin=subprocess.DEVNULL,  # Prevent stealing MCP's stdin
+    )
+
+    stderr_chunks: list[bytes] = []
+    stderr_thread = threading.Thread(
+        target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True
+    )
+    stderr_thread.start()
+
+    timed_out = threading.Event()
+
+    def kill_on_timeout():
+        timed_out.set()
+        process.kill()
+
+    timer = threading.Timer(_DIFF_TIMEOUT, kill_on_timeout)
+    timer.start()
+    try:
+        buf = bytearray()
+        truncated = False
+        while True:
+            chunk = process.stdout.read(_DIFF_CHUNK_SIZE)
+            if not chunk:
+                break
+            if truncated:
+                continue  # Keep draining so git doesn't block on a full pipe
+            buf.extend(chunk)
+            if len(buf) > _MAX_DIFF_BYTES:
+                del buf[_MAX_DIFF_BYTES:]
+                truncated = True
+        returncode = process.wait()
+    finally:
+        timer.cancel()
+
+    stderr_thread.join(timeout=5)
+    stderr = b"".join(stderr_chunks).decode("utf-8", "replace")
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(args, _DIFF_TIMEOUT, stderr=stderr)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, args, stderr=stderr)
+
+    if truncated:
+        buf.extend(b"\n\n... [DIFF TRUNCATED] ...")
+    return bytes(buf)
+
 
 def get_git_diff(target: str = "staged") -> str:
     """
@@ -63,31 +147,41 @@ def get_git_diff(target: str = "staged") -> str:
             args = ["git", "diff", target]
 
         # Add exclusion patterns
-        for pattern in EXCLUDE_PATTERNS:
-            args.extend(["--", f":!{pattern}"])
+        args.extend(["--", *_EXCLUDE_ARGS])
 
+        return _run_git_diff(args).decode("utf-8", "replace")
+    except subprocess.CalledProcessError as e:
+        return f"Error running git diff: {e.stderr}"
+    except FileNotFoundError:
+        return "Error: git is not installed or not in PATH"
+
+
+def get_changed_files() -> list[str]:
+    """Get list of changed files (staged + unstaged)."""
+    try:
+        # Diffing against HEAD returns the union of staged and unstaged
+        # changes in one call, already deduplicated by git
         result = subprocess.run(
-            args,
+            ["git", "diff", "HEAD", "--name-only", "--", *_EXCLUDE_ARGS],
             capture_output=True,
             text=True,
             check=True,
             encoding="utf-8",
-            stdin=subprocess.DEVNULL,  # Prevent stealing MCP's stdin
+            stdin=subprocess.DEVNULL,
             timeout=30,
         )
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        return f"Error running git diff: {e.stderr}"
-    except FileNotFoundError:
-        return "Error: git is not installed or not in PATH"
+        return [f for f in result.stdout.splitlines() if f]  # Filter empty strings
+    except subprocess.CalledProcessError:
+        # HEAD doesn't resolve in a repo with no commits yet - fall back to
+        # separate staged/unstaged calls that don't need a ref
+        return _get_changed_files_no_head()
 
 
-def get_changed_files() -> list[str]:
-    """Get list of changed files (staged + unstaged)."""
+def _get_changed_files_no_head() -> list[str]:
+    """Fallback for repos without a HEAD commit (nothing committed yet)."""
     try:
-        # Get staged files
         staged = subprocess.run(
-            ["git", "diff", "--staged", "--name-only"],
+            ["git", "diff", "--staged", "--name-only", "--", *_EXCLUDE_ARGS],
             capture_output=True,
             text=True,
             check=True,
@@ -95,9 +189,8 @@ def get_changed_files() -> list[str]:
             stdin=subprocess.DEVNULL,
             timeout=30,
         )
-        # Get unstaged files
         unstaged = subprocess.run(
-            ["git", "diff", "--name-only"],
+            ["git", "diff", "--name-only", "--", *_EXCLUDE_ARGS],
             capture_output=True,
             text=True,
             check=True,
@@ -105,14 +198,48 @@ def get_changed_files() -> list[str]:
             stdin=subprocess.DEVNULL,
             timeout=30,
         )
-        files = set(
-            staged.stdout.strip().split("\n") + unstaged.stdout.strip().split("\n")
-        )
-        return [f for f in files if f]  # Filter empty strings
+        files = staged.stdout.splitlines() + unstaged.stdout.splitlines()
+        return [f for f in dict.fromkeys(files) if f]
     except subprocess.CalledProcessError:
         return []
 
 
+# LRU cache of file contents keyed by (path, mtime_ns, size, limit) - the LLM
+# tool loop often re-requests the same files across iterations. The lock keeps
+# the get/move_to_end and insert/evict pairs atomic, since artifact loading and
+# linked-file reads hit the cache from thread-pool workers.
+_FILE_CACHE: OrderedDict[tuple[str, int, int, int | None], str] = OrderedDict()
+_FILE_CACHE_SIZE = 64
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+def _read_file_cached(filepath: str, limit: int | None = None) -> str:
+    """
+    Read a file, serving repeats from a small in-process LRU cache.
+
+    When `limit` is given, only limit+1 characters are read from disk -
+    enough for callers to detect truncation without pulling a huge file
+    into memory just to slice it. Keyed by (path, mtime_ns, size, limit)
+    so an edited file is re-read automatically. Thread-safe. Raises like
+    open() when the file is missing.
+    """
+    stat = os.stat(filepath)
+    key = (filepath, stat.st_mtime_ns, stat.st_size, limit)
+    with _FILE_CACHE_LOCK:
+        cached = _FILE_CACHE.get(key)
+        if cached is not None:
+            _FILE_CACHE.move_to_end(key)
+            return cached
+
+    with open(filepath, "r", encoding="utf-8", errors="replace") as f:
+        content = f.read(limit + 1) if limit is not None else f.read()
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE[key] = content
+        if len(_FILE_CACHE) > _FILE_CACHE_SIZE:
+            _FILE_CACHE.popitem(last=False)
+    return content
+
+
 def read_context_files(filepaths: list[str]) -> str:
     """
     Read multiple context files and format them for the prompt.
@@ -123,20 +250,19 @@ def read_context_files(filepaths: list[str]) -> str:
     Returns:
         Formatted string with file contents.
     """
-    context = ""
+    parts: list[str] = []
     for filepath in filepaths:
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = f.read()
-                # Truncate very large files
-                if len(content) > 50000:
-                    content = content[:50000] + "\n\n... [TRUNCATED] ..."
-                context += f"\n\n--- FILE: {filepath} ---\n{content}"
+            content = _read_file_cached(filepath, limit=50000)
+            # Truncate very large files
+            if len(content) > 50000:
+                content = content[:50000] + "\n\n... [TRUNCATED] ..."
+            parts.append(f"\n\n--- FILE: {filepath} ---\n{content}")
         except FileNotFoundError:
-            context += f"\n\n(Note: Context file '{filepath}' not found)\n"
+            parts.append(f"\n\n(Note: Context file '{filepath}' not found)\n")
         except Exception as e:
-            context += f"\n\n(Error reading '{filepath}': {e})\n"
-    return context
+            parts.append(f"\n\n(Error reading '{filepath}': {e})\n")
+    return "".join(parts)
 
 
 def normalize_file_uri_path(path: str) -> str:
@@ -148,19 +274,28 @@ def normalize_file_uri_path(path: str) -> str:
     - Unix paths: file:///foo -> /foo
     - Already normalized paths
     """
+    # Common case first: Unix path already starting with /
+    if path.startswith("/"):
+        return path
     # Check for Windows drive letter (e.g., C:/)
     if len(path) > 1 and path[1] == ":":
         return path
-    # Unix path - ensure it starts with /
-    if not path.startswith("/"):
-        return "/" + path
-    return path
+    return "/" + path
+
+
+# Precompiled pattern for render_diffs(file:///path/to/file), used when
+# substituting diffs into artifact content
+_RENDER_DIFFS_RE = re.compile(r"render_diffs\s*\(\s*file:///([^)]+)\s*\)")
 
 
 def parse_file_links(content: str) -> tuple[list[str], list[str]]:
     """
     Parse markdown content for render_diffs() and file:// links.
 
+    Single forward scan over the content: each file:/// occurrence is
+    classified by what immediately precedes it - a render_diffs( call or
+    a markdown link's ]( - instead of two separate regex passes.
+
     Args:
         content: Markdown content to parse.
 
@@ -172,29 +307,195 @@ def parse_file_links(content: str) -> tuple[list[str], list[str]]:
     diff_files = []
     read_files = []
 
-    # Pattern for render_diffs(file:///path/to/file)
-    render_diff_pattern = r"render_diffs\s*\(\s*file:///([^)]+)\s*\)"
-    for match in re.finditer(render_diff_pattern, content):
-        path = unquote(match.group(1))
-        diff_files.append(normalize_file_uri_path(path))
-
-    # Pattern for markdown links: [text](file:///path)
-    # But exclude render_diffs matches
-    link_pattern = r"\[([^\]]*)\]\(file:///([^)]+)\)"
-    for match in re.finditer(link_pattern, content):
-        path = unquote(match.group(2))
+    pos = 0
+    while True:
+        hit = content.find("file:///", pos)
+        if hit == -1:
+            break
+
+        # Look backward (allowing whitespace) for the opening of the construct.
+        # A bare URI (prose, code block) only advances past its own scheme so
+        # we never consume the closing paren of a later valid link.
+        before = content[max(0, hit - 20) : hit].rstrip()
+        if not before.endswith("("):
+            pos = hit + len("file:///")
+            continue
+
+        end = content.find(")", hit)
+        if end == -1:
+            break
+        pos = end + 1
+
+        path = unquote(content[hit + len("file:///") : end].rstrip())
         full_path = normalize_file_uri_path(path)
-        # Don't duplicate files already in diff_files
-        if full_path not in diff_files:
+
+        opener = before[:-1].rstrip()
+        if opener.endswith("render_diffs"):
+            diff_files.append(full_path)
+        elif opener.endswith("]"):
             read_files.append(full_path)
 
+    # Don't duplicate files already in diff_files (a render_diffs call may
+    # appear after a markdown link to the same file)
+    read_files = [f for f in read_files if f not in diff_files]
+
     return diff_files, read_files
 
 
+# Matches the header line git prints at the start of each file's diff section.
+# Bytes pattern: sections are split at the byte level and only decoded when a
+# caller actually looks one up. Covers both header forms: quoted ("a/..." for
+# paths with special characters) and unquoted, where the greedy match
+# backtracks to the final ' b/' so paths containing spaces still parse.
+_DIFF_HEADER_RE = re.compile(
+    rb'^diff --git (?:"a/((?:[^"\\]|\\.)*)"|a/(.*) b/)', re.MULTILINE
+)
+
+# git's C-style escapes inside quoted paths (octal escapes handled separately)
+_GIT_PATH_ESCAPES = {
+    ord("a"): 7,
+    ord("b"): 8,
+    ord("t"): 9,
+    ord("n"): 10,
+    ord("v"): 11,
+    ord("f"): 12,
+    ord("r"): 13,
+    ord('"'): ord('"'),
+    ord("\\"): ord("\\"),
+}
+
+
+def _unquote_git_path(quoted: bytes) -> bytes:
+    """Undo git's C-style path quoting (backslash and \\NNN octal escapes)."""
+    out = bytearray()
+    i = 0
+    n = len(quoted)
+    while i < n:
+        ch = quoted[i]
+        if ch != ord("\\") or i + 1 >= n:
+            out.append(ch)
+            i += 1
+            continue
+        nxt = quoted[i + 1]
+        if ord("0") <= nxt <= ord("7"):
+            out.append(int(quoted[i + 1 : i + 4], 8))
+            i += 4
+        else:
+            out.append(_GIT_PATH_ESCAPES.get(nxt, nxt))
+            i += 2
+    return bytes(out)
+
+
+def _split_diff_by_file(diff_bytes: bytes) -> dict[str, bytes]:
+    """Split combined git diff output into per-file byte sections keyed by path."""
+    matches = list(_DIFF_HEADER_RE.finditer(diff_bytes))
+    sections = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(diff_bytes)
+        quoted, plain = match.group(1), match.group(2)
+        raw_path = _unquote_git_path(quoted) if quoted is not None else plain
+        sections[raw_path.decode("utf-8", "replace")] = diff_bytes[match.start() : end]
+    return sections
+
+
+@functools.lru_cache(maxsize=4)
+def _repo_toplevel(cwd: str) -> str | None:
+    """Absolute path of the git worktree root for cwd, or None outside a repo."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            capture_output=True,
+            text=True,
+            check=True,
+            encoding="utf-8",
+            stdin=subprocess.DEVNULL,
+            timeout=30,
+            cwd=cwd,
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError, OSError):
+        return None
+    return result.stdout.strip()
+
+
+def _lookup_diff(sections: dict[str, bytes], path: str) -> str:
+    """
+    Find and decode the diff section for a path.
+
+    Git headers use repo-relative paths, but callers usually pass absolute
+    paths (from file:// URIs), so resolve those against the repo toplevel
+    and look up exactly - a suffix heuristic would attach the wrong diff
+    when basenames collide (config.py vs lib/config.py).
+    """
+    section = sections.get(path)
+    if section is None and os.path.isabs(path):
+        toplevel = _repo_toplevel(os.getcwd())
+        if toplevel:
+            relative = os.path.relpath(
+                os.path.realpath(path), os.path.realpath(toplevel)
+            ).replace("\\", "/")
+            section = sections.get(relative)
+    if section is None:
+        return ""
+    return section.decode("utf-8", "replace")
+
+
+def _format_diff_sections(sections: dict[str, str]) -> str:
+    """Format per-file diff sections into the combined output string."""
+    return "\n\n".join(
+        f"# Diff for: {path}\n{section}" for path, section in sections.items()
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _full_diff_index(target: str = "staged") -> dict[str, bytes] | None:
+    """
+    Run ONE git diff over the whole repo and index it per file.
+
+    All scoped-diff lookups (across artifacts and render_diffs tags) are
+    served from this in-memory index, so a review costs one diff
+    subprocess per target instead of one per file. run_agentic_review
+    clears the cache at the start of each review so results stay fresh.
+
+    Returns None when the diff itself failed (bad ref, timeout, no git) -
+    callers must report that rather than treating it as an empty diff.
+    """
+    # quotePath=false keeps non-ASCII paths unquoted in the headers so the
+    # index keys match what callers pass in
+    if target == "staged":
+        args = ["git", "-c", "core.quotePath=false", "diff", "--staged"]
+    elif target == "unstaged":
+        args = ["git", "-c", "core.quotePath=false", "diff"]
+    else:
+        args = ["git", "-c", "core.quotePath=false", "diff", target]
+
+    args.extend(["--", *_EXCLUDE_ARGS])
+
+    try:
+        diff_bytes = _run_git_diff(args)
+    except subprocess.CalledProcessError as e:
+        logger.error(
+            "git diff failed for target %r: %s",
+            target,
+            e.stderr.strip() if e.stderr else e,
+        )
+        return None
+    except subprocess.TimeoutExpired:
+        logger.error("git diff timed out for target %r", target)
+        return None
+    except FileNotFoundError:
+        logger.error("git is not installed or not in PATH")
+        return None
+
+    return _split_diff_by_file(diff_bytes)
+
+
 def get_scoped_diff(files: list[str], target: str = "staged") -> str:
     """
     Get git diff for specific files only.
 
+    Served from the cached full-repo diff index (see _full_diff_index),
+    so repeated calls cost no extra subprocesses.
+
     Args:
         files: List of file paths to diff.
         target: 'staged', 'unstaged', or a git ref.
@@ -205,36 +506,76 @@ def get_scoped_diff(files: list[str], target: str = "staged") -> str:
     if not files:
         return ""
 
-    diffs = []
+    index = _full_diff_index(target)
+    if index is None:
+        return "\n\n".join(
+            f"# Error getting diff for {filepath}: git diff failed for target '{target}'"
+            for filepath in files
+        )
+
+    sections = {}
+    # Normalize separators with a plain str.replace - no need to pay for a
+    # Path object per file just to call .as_posix()
     for filepath in files:
+        section = _lookup_diff(index, filepath.replace("\\", "/"))
+        if section:
+            sections[filepath] = section
+    return _format_diff_sections(sections)
+
+
+def _process_parsed(
+    content: str,
+    diff_files: list[str],
+    read_files: list[str],
+    diff_target: str,
+) -> tuple[str, str]:
+    """
+    Resolve links in already-parsed artifact content.
+
+    Shared by process_artifact_with_links and the artifact loader so each
+    caller reads and parses the file exactly once.
+    """
+    # Fast path: no render_diffs tags means no diffing or substitution at all
+    if diff_files:
+        # Generate scoped diff for render_diffs files (served from the cached index)
+        scoped_diff = get_scoped_diff(diff_files, diff_target)
+        index = _full_diff_index(diff_target)
+
+        # Replace render_diffs() calls with actual diff content, looked up in
+        # the cached index instead of spawning a subprocess per match
+        def replace_render_diff(match):
+            path = unquote(match.group(1))
+            full_path = normalize_file_uri_path(path)
+            if index is None:
+                # Don't claim "no changes" when the diff itself failed
+                return f"(Error: could not generate diff for {full_path})"
+            file_diff = _lookup_diff(index, full_path)
+            if file_diff:
+                return f"```diff\n# Diff for: {full_path}\n{file_diff}\n```"
+            return f"(No changes in {full_path})"
+
+        processed = _RENDER_DIFFS_RE.sub(replace_render_diff, content)
+    else:
+        scoped_diff = ""
+        processed = content
+
+    # Read linked files for additional context (concurrent - independent I/O)
+    def read_linked(read_path: str) -> str | None:
         try:
-            # Normalize path for git
-            normalized = Path(filepath).as_posix()
-
-            if target == "staged":
-                args = ["git", "diff", "--staged", "--", normalized]
-            elif target == "unstaged":
-                args = ["git", "diff", "--", normalized]
-            else:
-                args = ["git", "diff", target, "--", normalized]
-
-            result = subprocess.run(
-                args,
-                capture_output=True,
-                text=True,
-                check=True,
-                encoding="utf-8",
-                stdin=subprocess.DEVNULL,
-                timeout=30,
-            )
-            if result.stdout.strip():
-                diffs.append(f"# Diff for: {filepath}\n{result.stdout}")
-        except subprocess.CalledProcessError:
-            diffs.append(f"# No diff available for: {filepath}")
-        except Exception as e:
-            diffs.append(f"# Error getting diff for {filepath}: {e}")
+            file_content = _read_file_cached(read_path, limit=10000)
+        except Exception:
+            return None
+        if len(file_content) > 10000:
+            file_content = file_content[:10000] + "\n... [TRUNCATED]"
+        return f"\n\n--- LINKED FILE: {read_path} ---\n{file_content}"
 
-    return "\n\n".join(diffs)
+    linked = read_files[:5]  # Limit to 5 linked files
+    linked_parts: list[str] = []
+    if linked:
+        with ThreadPoolExecutor(max_workers=len(linked)) as executor:
+            linked_parts = [part for part in executor.map(read_linked, linked) if part]
+
+    return processed + "".join(linked_parts), scoped_diff
 
 
 def process_artifact_with_links(
@@ -253,45 +594,96 @@ def process_artifact_with_links(
         - scoped_diff: Combined diff for all files mentioned in render_diffs
     """
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = _read_file_cached(filepath)
     except FileNotFoundError:
         return f"(Artifact not found: {filepath})", ""
 
     diff_files, read_files = parse_file_links(content)
+    return _process_parsed(content, diff_files, read_files, diff_target)
 
-    # Generate scoped diff for render_diffs files
-    scoped_diff = get_scoped_diff(diff_files, diff_target)
 
-    # Replace render_diffs() calls with actual diff content
-    def replace_render_diff(match):
-        path = unquote(match.group(1))
-        full_path = normalize_file_uri_path(path)
-        # Get diff for this specific file
-        file_diff = get_scoped_diff([full_path], diff_target)
-        if file_diff:
-            return f"```diff\n{file_diff}\n```"
-        return f"(No changes in {full_path})"
-
-    processed = re.sub(
-        r"render_diffs\s*\(\s*file:///([^)]+)\s*\)", replace_render_diff, content
-    )
+def _load_one_artifact(artifact: str, diff_target: str) -> tuple[str, list[str]] | None:
+    """
+    Read one artifact and resolve its links.
+
+    Returns (formatted_context, diff_files), or None if the artifact is
+    missing. Safe to run concurrently for independent artifacts.
+    """
+    try:
+        content = _read_file_cached(artifact)
+    except FileNotFoundError:
+        return None  # Silently skip missing artifacts
+    except Exception as e:
+        logger.error("  ✗ Error loading %s: %s", artifact, e)
+        return None
+
+    logger.info("  ✓ Loaded %s", artifact)
+
+    # Parse for render_diffs and file links, then resolve render_diffs inline
+    # from the already-read content - no second read or parse
+    diff_files, linked_files = parse_file_links(content)
+    processed_content, _ = _process_parsed(content, diff_files, linked_files, diff_target)
+    return f"\n\n--- ARTIFACT: {artifact} ---\n{processed_content}", diff_files
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str, base_url: str, timeout: float | None = None) -> OpenAI:
+    """
+    Build (or reuse) an OpenAI client for the given endpoint.
+
+    Cached so repeated reviews in one server process reuse the client's
+    httpx connection pool - keep-alive connections skip the TLS
+    handshake on every review after the first.
+    """
+    return OpenAI(api_key=api_key, base_url=base_url, timeout=timeout)
 
-    # Read linked files for additional context
-    linked_context = ""
-    for read_path in read_files[:5]:  # Limit to 5 linked files
-        try:
-            with open(read_path, "r", encoding="utf-8") as f:
-                file_content = f.read()
-                if len(file_content) > 10000:
-                    file_content = file_content[:10000] + "\n... [TRUNCATED]"
-                linked_context += (
-                    f"\n\n--- LINKED FILE: {read_path} ---\n{file_content}"
-                )
-        except Exception:
-            pass
 
-    return processed + linked_context, scoped_diff
+def _stream_completion(client: OpenAI, **kwargs) -> tuple[str, list[dict]]:
+    """
+    Call chat.completions.create with stream=True and merge the deltas.
+
+    Streaming overlaps network transfer with our processing and cuts
+    time-to-first-token on long reviews.
+
+    Returns:
+        Tuple of (content, tool_calls) where tool_calls is a list of
+        merged tool-call dicts in OpenAI message format (empty if the
+        model made no tool calls).
+    """
+    stream = client.chat.completions.create(stream=True, **kwargs)
+
+    content_parts: list[str] = []
+    tool_calls_by_index: dict[int, dict] = {}
+
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        if delta is None:
+            continue
+        if delta.content:
+            content_parts.append(delta.content)
+        for tc in delta.tool_calls or []:
+            # Tool-call deltas arrive keyed by index; id/name come in the
+            # first chunk, arguments accumulate across chunks
+            entry = tool_calls_by_index.setdefault(
+                tc.index,
+                {
+                    "id": "",
+                    "type": "function",
+                    "function": {"name": "", "arguments": ""},
+                },
+            )
+            if tc.id:
+                entry["id"] = tc.id
+            if tc.function:
+                if tc.function.name:
+                    entry["function"]["name"] = tc.function.name
+                if tc.function.arguments:
+                    entry["function"]["arguments"] += tc.function.arguments
+
+    tool_calls = [tool_calls_by_index[i] for i in sorted(tool_calls_by_index)]
+    return "".join(content_parts), tool_calls
 
 
 def generate_critique(diff: str, context: str = "") -> str:
@@ -310,10 +702,7 @@ def generate_critique(diff: str, context: str = "") -> str:
         return "Error: ZHIPU_API_KEY environment variable is not set."
 
     # Use the Z.AI coding endpoint as per docs
-    client = OpenAI(
-        api_key=api_key,
-        base_url="https://api.z.ai/api/coding/paas/v4",
-    )
+    client = _get_client(api_key, "https://api.z.ai/api/coding/paas/v4")
 
     system_prompt = """You are a Senior Code Reviewer. Your goal is to verify if the code changes
 match the intent described in the provided documentation.
@@ -336,10 +725,11 @@ Based on the artifacts and diff above, provide a code review. If there are no is
 
     try:
         # Log the prompt sizes for debugging
-        logger.info(f"System Prompt Length: {len(system_prompt)} chars")
-        logger.info(f"User Prompt Length: {len(user_prompt)} chars")
+        logger.info("System Prompt Length: %d chars", len(system_prompt))
+        logger.info("User Prompt Length: %d chars", len(user_prompt))
 
-        response = client.chat.completions.create(
+        content, _ = _stream_completion(
+            client,
             model="GLM-4.7",
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -347,9 +737,9 @@ Based on the artifacts and diff above, provide a code review. If there are no is
             ],
             temperature=0.2,
         )
-        return response.choices[0].message.content
+        return content
     except Exception as e:
-        logger.error(f"Error calling GLM-4.7 API in generate_critique: {e}")
+        logger.error("Error calling GLM-4.7 API in generate_critique: %s", e)
         return f"Error calling GLM-4.7 API: {e}"
 
 
@@ -462,6 +852,9 @@ def run_agentic_review(
         # Change to the working directory so git commands work correctly
         os.chdir(working_dir)
 
+        # Diff index is cached per target; drop anything from a previous review
+        _full_diff_index.cache_clear()
+
         api_key = os.getenv("ZHIPU_API_KEY")
         if not api_key:
             return "Error: ZHIPU_API_KEY environment variable is not set."
@@ -469,11 +862,8 @@ def run_agentic_review(
         # Configurable API endpoint
         base_url = os.getenv("ZHIPU_BASE_URL", "https://api.z.ai/api/coding/paas/v4")
 
-        client = OpenAI(
-            api_key=api_key,
-            base_url=base_url,
-            timeout=120.0,  # 2 minute timeout per request
-        )
+        # 2 minute timeout per request
+        client = _get_client(api_key, base_url, 120.0)
 
         # Default artifacts to ALWAYS check
         default_artifacts = [
@@ -484,41 +874,42 @@ def run_agentic_review(
         artifacts_to_read = default_artifacts + (context_files or [])
 
         # Pre-read artifacts that exist AND resolve their links
-        artifact_context = ""
+        artifact_parts: list[str] = []
         all_diff_files = []
 
         logger.info("Loading artifacts...")
-        for artifact in artifacts_to_read:
-            try:
-                with open(artifact, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    logger.info(f"  ✓ Loaded {artifact}")
-
-                    # Parse for render_diffs and file links
-                    diff_files, linked_files = parse_file_links(content)
-                    all_diff_files.extend(diff_files)
-
-                    # Process the artifact - resolve render_diffs inline
-                    processed_content, _ = process_artifact_with_links(
-                        artifact, diff_target
-                    )
-                    artifact_context += (
-                        f"\n\n--- ARTIFACT: {artifact} ---\n{processed_content}"
-                    )
-
-            except FileNotFoundError:
-                pass  # Silently skip missing artifacts
-            except Exception as e:
-                logger.error(f"  ✗ Error loading {artifact}: {e}")
+        # Build the diff index once before fanning out - lru_cache doesn't
+        # deduplicate in-flight calls, so cold-cache workers would otherwise
+        # each spawn their own full-repo git diff
+        _full_diff_index(diff_target)
+
+        # Artifacts are independent, so load them concurrently (each one does
+        # file I/O and may spawn git subprocesses). map() preserves order.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            loaded = executor.map(
+                lambda artifact: _load_one_artifact(artifact, diff_target),
+                artifacts_to_read,
+            )
+            for result in loaded:
+                if result is None:
+                    continue
+                formatted, diff_files = result
+                artifact_parts.append(formatted)
+                all_diff_files.extend(diff_files)
+        artifact_context = "".join(artifact_parts)
+
+        # Deduplicate while preserving order - the same file is often
+        # referenced from several artifacts (plan, task, walkthrough)
+        all_diff_files = list(dict.fromkeys(all_diff_files))
 
         # Determine which files to diff
         # Priority: focus_files > files from artifacts > all changed files
         if focus_files:
             files_to_diff = focus_files
-            logger.info(f"Focusing on {len(files_to_diff)} specified files")
+            logger.info("Focusing on %d specified files", len(files_to_diff))
         elif all_diff_files:
             files_to_diff = all_diff_files
-            logger.info(f"Found {len(files_to_diff)} files in artifacts")
+            logger.info("Found %d files in artifacts", len(files_to_diff))
         else:
             files_to_diff = None  # Let reviewer fetch what it needs
             logger.info("No specific files - reviewer will decide")
@@ -581,11 +972,11 @@ Be concise but thorough. Ignore minor style issues."""
         max_iterations = int(os.getenv("MAX_REVIEW_ITERATIONS", "20"))
         iteration = 0
         logger.info("Starting review...")
-        logger.info(f"Found {len(changed_files)} changed files")
-        logger.info(f"Loaded {len(artifacts_to_read)} artifacts")
+        logger.info("Found %d changed files", len(changed_files))
+        logger.info("Loaded %d artifacts", len(artifacts_to_read))
 
         for iteration in range(max_iterations):
-            logger.info(f"Iteration {iteration + 1}: Calling GLM-4.7...")
+            logger.info("Iteration %d: Calling GLM-4.7...", iteration + 1)
 
             # Log exact payload size for debugging
             total_chars = 0
@@ -597,16 +988,18 @@ Be concise but thorough. Ignore minor style issues."""
                 total_chars += len(content or "")
 
             logger.info(
-                f"  Payload size: {total_chars} chars, {len(messages)} messages"
+                "  Payload size: %d chars, %d messages", total_chars, len(messages)
             )
 
             import time
 
             backoff = 1
-            response = None
+            content = ""
+            tool_calls: list[dict] = []
             for retry in range(3):
                 try:
-                    response = client.chat.completions.create(
+                    content, tool_calls = _stream_completion(
+                        client,
                         model="GLM-4.7",
                         messages=messages,
                         tools=REVIEWER_TOOLS,
@@ -619,7 +1012,7 @@ Be concise but thorough. Ignore minor style issues."""
                         code in str(e) for code in ["500", "502", "503", "429"]
                     ):
                         logger.warning(
-                            f"  Retry {retry + 1} due to {e}. Waiting {backoff}s..."
+                            "  Retry %d due to %s. Waiting %ds...", retry + 1, e, backoff
                         )
                         time.sleep(backoff)
                         backoff *= 2
@@ -637,25 +1030,33 @@ Be concise but thorough. Ignore minor style issues."""
 
                     return error_msg
 
-            message = response.choices[0].message
-
             # If no tool calls, we're done - return the final message
-            if not message.tool_calls:
+            if not tool_calls:
                 logger.info("Review complete!")
-                return message.content or "No review generated."
+                return content or "No review generated."
 
             # Process tool calls
-            messages.append(message)
-            logger.info(f"GLM requested {len(message.tool_calls)} tool(s)")
+            messages.append(
+                {
+                    "role": "assistant",
+                    "content": content or None,
+                    "tool_calls": tool_calls,
+                }
+            )
+            logger.info("GLM requested %d tool(s)", len(tool_calls))
 
-            for tool_call in message.tool_calls:
-                func_name = tool_call.function.name
+            for tool_call in tool_calls:
+                func_name = tool_call["function"]["name"]
+                arguments = tool_call["function"]["arguments"]
                 try:
-                    func_args = json.loads(tool_call.function.arguments)
-                except json.JSONDecodeError:
+                    if orjson is not None:
+                        func_args = orjson.loads(arguments)
+                    else:
+                        func_args = json.loads(arguments)
+                except ValueError:  # covers both orjson and json decode errors
                     func_args = {}
 
-                logger.info(f"  → {func_name}({func_args})")
+                logger.info("  → %s(%s)", func_name, func_args)
 
                 # Execute the tool
                 result = _execute_tool(func_name, func_args)
@@ -664,7 +1065,7 @@ Be concise but thorough. Ignore minor style issues."""
                 messages.append(
                     {
                         "role": "tool",
-                        "tool_call_id": tool_call.id,
+                        "tool_call_id": tool_call["id"],
                         "content": result,
                     }
                 )